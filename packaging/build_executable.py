@@ -9,8 +9,8 @@ heuristic that is commonly triggered by PyInstaller's one-file bootstrapper.
 from __future__ import annotations
 
 import argparse
+import os
 import shutil
-import subprocess
 import sys
 from pathlib import Path
 
@@ -75,13 +75,45 @@ def _prepare_icon() -> Path:
         if not available_sizes:
             available_sizes = [image.size[0]]
 
+        # Resample every size from the largest variant so filtering artefacts do
+        # not accumulate at the small tray and taskbar sizes.
+        top = available_sizes[0]
+        largest = image
+        if largest.size != (top, top):
+            largest = image.resize((top, top), Image.LANCZOS)
+        variants = [largest]
+        for size in available_sizes[1:]:
+            variants.append(largest.resize((size, size), Image.LANCZOS))
+
         icon_sizes = [(size, size) for size in available_sizes]
-        image.save(ICON_CONVERTED, format="ICO", sizes=icon_sizes)
+        variants[0].save(
+            ICON_CONVERTED,
+            format="ICO",
+            sizes=icon_sizes,
+            append_images=variants[1:],
+        )
 
     return ICON_CONVERTED
 
 
-def build(mode: str = "onedir") -> Path:
+def _run_pyinstaller(arguments: list[str]) -> None:
+    """Invoke PyInstaller in-process from the repository root.
+
+    PyInstaller writes ``build/``, ``dist/`` and the ``.spec`` file relative to
+    the working directory, so the call is wrapped in a temporary ``chdir``.
+    """
+
+    import PyInstaller.__main__  # type: ignore
+
+    previous_cwd = os.getcwd()
+    os.chdir(REPO_ROOT)
+    try:
+        PyInstaller.__main__.run(arguments)
+    finally:
+        os.chdir(previous_cwd)
+
+
+def build(mode: str = "onedir", *, clean: bool = False) -> Path:
     """Create an executable using PyInstaller.
 
     Parameters
@@ -90,6 +122,11 @@ def build(mode: str = "onedir") -> Path:
         ``"onedir"`` (default) keeps the unpacked distribution to mitigate
         Windows Defender false positives. ``"onefile"`` mirrors the previous
         single-file behaviour.
+    clean:
+        Pass ``--clean`` to PyInstaller, discarding its cache before building,
+        and remove the ``build/`` work directory afterwards. Left off by default
+        so the work directory, and the analysis cached in it, is reused by the
+        next build.
 
     Returns
     -------
@@ -105,10 +142,6 @@ def build(mode: str = "onedir") -> Path:
     icon_path = _prepare_icon()
 
     command = [
-        sys.executable,
-        "-m",
-        "PyInstaller",
-        "--clean",
         "--noconfirm",
         "--noconsole",
         "--name",
@@ -125,7 +158,10 @@ def build(mode: str = "onedir") -> Path:
     else:
         command.append("--onedir")
 
-    subprocess.run(command, check=True, cwd=REPO_ROOT)
+    if clean:
+        command.append("--clean")
+
+    _run_pyinstaller(command)
 
     dist_dir = REPO_ROOT / "dist"
     if mode == "onefile":
@@ -153,11 +189,13 @@ def build(mode: str = "onedir") -> Path:
         final_dir = OUTPUT_DIR / _BASE_NAME
         if final_dir.exists():
             shutil.rmtree(final_dir)
-        shutil.copytree(dist_dir_onedir, final_dir)
+        shutil.move(str(dist_dir_onedir), final_dir)
         result_path = final_dir / EXECUTABLE_NAME
 
-    # Remove temporary build artefacts generated by PyInstaller.
-    shutil.rmtree(REPO_ROOT / "build", ignore_errors=True)
+    # Remove temporary build artefacts generated by PyInstaller. ``build/``
+    # holds the Analysis/PYZ cache, so it is only removed for clean builds.
+    if clean:
+        shutil.rmtree(REPO_ROOT / "build", ignore_errors=True)
     shutil.rmtree(dist_dir, ignore_errors=True)
     spec_file = REPO_ROOT / f"{_BASE_NAME}.spec"
     if spec_file.exists():
@@ -178,10 +216,15 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
             "single-executable output."
         ),
     )
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="Clear PyInstaller's cache before building instead of reusing it.",
+    )
     return parser.parse_args(argv)
 
 
 if __name__ == "__main__":  # pragma: no cover - manual execution entrypoint
     args = _parse_args()
-    path = build(mode=args.mode)
+    path = build(mode=args.mode, clean=args.clean)
     print(f"Executable created at {path}")
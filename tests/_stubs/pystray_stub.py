@@ -0,0 +1,21 @@
+"""Minimal stand-in for :mod:`pystray` used when running the unit tests."""
+
+
+class Icon:
+    def __init__(self, *args, **kwargs) -> None:
+        pass
+
+    def run_detached(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+class MenuItem:
+    def __init__(self, *args, **kwargs) -> None:
+        pass
+
+
+def Menu(*args, **kwargs) -> None:
+    return None
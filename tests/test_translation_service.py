@@ -0,0 +1,180 @@
+import copy
+import json
+import pickle
+import unittest
+import unittest.mock as mock
+
+from translation_service import GoogleTranslateClient, TranslationError, TranslationResult
+
+
+def _payload(translated: str = "こんにちは", detected: str = "en") -> bytes:
+    return json.dumps([[[translated, "hello", None, None]], None, detected]).encode("utf-8")
+
+
+class FakeResponse:
+    def __init__(self, payload: bytes, status: int = 200, will_close: bool = False) -> None:
+        self._payload = payload
+        self.status = status
+        self.will_close = will_close
+
+    def read(self) -> bytes:
+        return self._payload
+
+
+class FakeConnection:
+    def __init__(self, host: str, timeout: float = None) -> None:
+        self.host = host
+        self.timeout = timeout
+        self.paths = []
+        self.closed = False
+        self.connected = False
+        self.fail_next_request = False
+        self.next_error = None
+        self.response = FakeResponse(_payload())
+
+    def connect(self) -> None:
+        self.connected = True
+
+    def request(self, method: str, path: str, headers=None) -> None:
+        if self.fail_next_request:
+            self.fail_next_request = False
+            raise ConnectionResetError("connection closed by peer")
+        if self.next_error is not None:
+            error, self.next_error = self.next_error, None
+            raise error
+        self.paths.append(path)
+
+    def getresponse(self) -> FakeResponse:
+        return self.response
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TranslationResultTests(unittest.TestCase):
+    def test_copy_and_pickle_round_trip(self) -> None:
+        result = TranslationResult(text="a", detected_source="en")
+
+        self.assertEqual(copy.copy(result), result)
+        self.assertEqual(copy.deepcopy(result), result)
+        self.assertEqual(pickle.loads(pickle.dumps(result)), result)
+
+
+class GoogleTranslateClientTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.connections = []
+
+        def factory(host, timeout=None):
+            connection = FakeConnection(host, timeout)
+            self.connections.append(connection)
+            return connection
+
+        patcher = mock.patch("translation_service.http.client.HTTPSConnection", side_effect=factory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.client = GoogleTranslateClient()
+        self.client._use_proxy = False
+
+    def test_translate_parses_response(self) -> None:
+        result = self.client.translate("hello", None, "ja")
+
+        self.assertEqual(result.text, "こんにちは")
+        self.assertEqual(result.detected_source, "en")
+        self.assertEqual(self.connections[0].host, "translate.googleapis.com")
+        self.assertTrue(self.connections[0].paths[0].startswith("/translate_a/single?"))
+        self.assertIn("sl=auto", self.connections[0].paths[0])
+
+    def test_text_is_percent_encoded_as_utf8(self) -> None:
+        self.client.translate("a b&c=日本", "en", "ja")
+
+        self.assertTrue(self.connections[0].paths[0].endswith("&q=a%20b%26c%3D%E6%97%A5%E6%9C%AC"))
+
+    def test_connection_is_reused_between_requests(self) -> None:
+        self.client.translate("hello", None, "ja")
+        self.client.translate("world", "en", "ja")
+
+        self.assertEqual(len(self.connections), 1)
+        self.assertEqual(len(self.connections[0].paths), 2)
+
+    def test_stale_connection_is_retried_once(self) -> None:
+        self.client.translate("hello", None, "ja")
+        self.connections[0].fail_next_request = True
+
+        result = self.client.translate("hello again", None, "ja")
+
+        self.assertEqual(result.text, "こんにちは")
+        self.assertTrue(self.connections[0].closed)
+        self.assertEqual(len(self.connections), 2)
+
+    def test_timeout_on_reused_connection_is_not_retried(self) -> None:
+        self.client.translate("hello", None, "ja")
+        self.connections[0].next_error = TimeoutError("timed out")
+
+        with self.assertRaises(TranslationError):
+            self.client.translate("hello again", None, "ja")
+        self.assertEqual(len(self.connections), 1)
+
+    def test_idle_connection_is_replaced_before_reuse(self) -> None:
+        with mock.patch("translation_service.time.monotonic", return_value=100.0):
+            self.client.translate("hello", None, "ja")
+        idle = 100.0 + self.client.max_idle + 1
+        with mock.patch("translation_service.time.monotonic", return_value=idle):
+            self.client.translate("world", None, "ja")
+
+        self.assertTrue(self.connections[0].closed)
+        self.assertEqual(len(self.connections), 2)
+        self.assertEqual(len(self.connections[0].paths), 1)
+
+    def test_http_error_status_raises_translation_error(self) -> None:
+        self.client.translate("hello", None, "ja")
+        self.connections[0].response = FakeResponse(b"", status=429)
+
+        with self.assertRaises(TranslationError):
+            self.client.translate("hello again", None, "ja")
+
+    def test_warm_up_opens_connection_reused_by_translate(self) -> None:
+        self.client.warm_up()
+
+        self.assertEqual(len(self.connections), 1)
+        self.assertTrue(self.connections[0].connected)
+        self.client.translate("hello", None, "ja")
+        self.assertEqual(len(self.connections), 1)
+        self.assertEqual(len(self.connections[0].paths), 1)
+
+    def test_close_releases_pooled_connection(self) -> None:
+        self.client.translate("hello", None, "ja")
+
+        self.client.close()
+
+        self.assertTrue(self.connections[0].closed)
+        self.client.translate("world", None, "ja")
+        self.assertEqual(len(self.connections), 2)
+
+    def test_repeated_translation_is_served_from_cache(self) -> None:
+        first = self.client.translate("hello", None, "ja")
+        second = self.client.translate("hello", None, "ja")
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.connections[0].paths), 1)
+
+    def test_cache_is_keyed_by_language_pair(self) -> None:
+        self.client.translate("hello", None, "ja")
+        self.client.translate("hello", None, "en")
+
+        self.assertEqual(len(self.connections[0].paths), 2)
+
+    def test_cache_evicts_least_recently_used_entry(self) -> None:
+        client = GoogleTranslateClient(cache_size=2)
+        client._use_proxy = False
+        client.translate("a", None, "ja")
+        client.translate("b", None, "ja")
+        client.translate("a", None, "ja")
+        client.translate("c", None, "ja")
+        client.translate("b", None, "ja")
+
+        self.assertEqual(len(self.connections[0].paths), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,37 +2,21 @@ import io
 import queue
 import threading
 import sys
+import tempfile
 import threading
-import types
+import time
 import unittest
-import unittest.mock as mock
 from contextlib import redirect_stdout
-from types import SimpleNamespace
+from pathlib import Path
 
 if "pystray" not in sys.modules:
-    stub_pystray = types.ModuleType("pystray")
+    from tests._stubs import pystray_stub
 
-    class _StubIcon:
-        def __init__(self, *args, **kwargs) -> None:
-            pass
-
-        def run_detached(self) -> None:
-            pass
-
-        def stop(self) -> None:
-            pass
-
-    class _StubMenuItem:
-        def __init__(self, *args, **kwargs) -> None:
-            pass
-
-    stub_pystray.Icon = _StubIcon
-    stub_pystray.Menu = lambda *args, **kwargs: None
-    stub_pystray.MenuItem = _StubMenuItem
-    sys.modules["pystray"] = stub_pystray
+    sys.modules["pystray"] = pystray_stub
 
+import translator_app
 from translator_app import CCTranslationApp, TranslationRequest, SystemTrayController
-from translation_service import TranslationError
+from translation_service import TranslationError, TranslationResult
 
 
 class FakeTime:
@@ -72,12 +56,16 @@ class FakeKeyboard:
 class FakeTranslator:
     def __init__(self, translated: str = "こんにちは", detected: str = "en") -> None:
         self.calls = []
-        self.translated = translated
-        self.detected = detected
+        self._result = TranslationResult(text=translated, detected_source=detected)
 
     def translate(self, text: str, src=None, dest=None):
         self.calls.append((text, src, dest))
-        return SimpleNamespace(text=self.translated, detected_source=self.detected)
+        return self._result
+
+
+# Default translator for tests that never inspect ``calls``. Tests asserting on
+# the recorded calls construct their own FakeTranslator instead.
+_SHARED_FAKE_TRANSLATOR = FakeTranslator()
 
 
 class ErroringTranslator:
@@ -86,6 +74,14 @@ class ErroringTranslator:
 
 
 class CCTranslationAppTestMixin:
+    # Never mutated by the tests, so a single instance is shared. Tests that
+    # need a clipboard with different behaviour pass their own via overrides.
+    _default_clipboard = FakeClipboard("hello")
+
+    def tearDown(self) -> None:
+        _SHARED_FAKE_TRANSLATOR.calls.clear()
+        super().tearDown()
+
     def _create_app(self, **overrides) -> CCTranslationApp:
         fake_time = overrides.pop("fake_time", None)
         if fake_time is None:
@@ -93,9 +89,9 @@ class CCTranslationAppTestMixin:
         defaults = dict(
             dest_language="ja",
             source_language=None,
-            translator_factory=lambda: FakeTranslator(),
+            translator_factory=lambda: _SHARED_FAKE_TRANSLATOR,
             keyboard_module=FakeKeyboard(),
-            clipboard_module=FakeClipboard("hello"),
+            clipboard_module=self._default_clipboard,
             time_provider=fake_time.now,
             display_callback=lambda original, translated, detected: None,
             double_copy_interval=0.5,
@@ -133,8 +129,8 @@ class CCTranslationAppTests(CCTranslationAppTestMixin, unittest.TestCase):
     def test_set_dest_language_retranslates_last_text(self):
         app = self._create_app()
         app._process_single_request(TranslationRequest(text="hello", src=None, dest="ja"))
-        with mock.patch("translator_app._save_dest_language"):
-            app._set_dest_language("en")
+        app._set_dest_language("en")
+        self.assertEqual(app._pending_dest_language, "en")
         request = app._request_queue.get_nowait()
         self.assertEqual(request.text, "hello")
         self.assertIsNone(request.src)
@@ -146,8 +142,8 @@ class CCTranslationAppTests(CCTranslationAppTestMixin, unittest.TestCase):
         app.source_language = "en"
         app.dest_language = "ja"
         app._process_single_request(TranslationRequest(text="こんにちは", src="en", dest="ja"))
-        with mock.patch("translator_app._save_dest_language"):
-            app._toggle_language()
+        app._toggle_language()
+        self.assertEqual(app._pending_dest_language, "en")
         request = app._request_queue.get_nowait()
         self.assertEqual(request.text, "こんにちは")
         self.assertEqual(request.src, "ja")
@@ -165,6 +161,18 @@ class CCTranslationAppTests(CCTranslationAppTestMixin, unittest.TestCase):
         self.assertEqual(request.dest, "en")
         self.assertFalse(request.reposition)
 
+    def test_next_request_coalesces_backlog_into_latest(self):
+        app = self._create_app()
+        app._request_queue.put(TranslationRequest(text="first", src=None, dest="ja"))
+        app._request_queue.put(TranslationRequest(text="second", src=None, dest="en", reposition=False))
+
+        request = app._next_request()
+
+        self.assertEqual(request.text, "second")
+        self.assertEqual(request.dest, "en")
+        self.assertTrue(request.reposition)
+        self.assertTrue(app._request_queue.empty())
+
     def test_process_single_request_uses_translator(self):
         translator = FakeTranslator(translated="translated", detected="en")
         captured = []
@@ -193,6 +201,32 @@ class CCTranslationAppTests(CCTranslationAppTestMixin, unittest.TestCase):
         self.assertIn("Error during translation", captured[0][1])
         self.assertEqual(captured[0][2], "en")
 
+    def test_window_setup_failure_is_reported_without_raising(self):
+        app = self._create_app(display_callback=None)
+
+        def failing_build():
+            raise RuntimeError("no display")
+
+        app._window_manager._build_window = failing_build
+
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            app._process_single_request(TranslationRequest(text="hello", src=None, dest="ja"))
+
+        self.assertIn("no display", buffer.getvalue())
+
+    def test_warm_up_failure_is_reported_without_raising(self):
+        def failing_factory():
+            raise RuntimeError("factory broke")
+
+        app = self._create_app(translator_factory=failing_factory)
+
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            app._warm_up_translator()
+
+        self.assertIn("factory broke", buffer.getvalue())
+
     def test_stop_sets_event(self):
         app = self._create_app()
         self.assertFalse(app._stop_event.is_set())
@@ -299,6 +333,21 @@ class CCTranslationAppTests(CCTranslationAppTestMixin, unittest.TestCase):
         self.assertEqual(len(translators), 2, "reboot should clear cached translator")
         self.assertIsNot(translators[0], translators[1])
 
+    def test_reboot_closes_previous_translator(self):
+        class ClosableTranslator(FakeTranslator):
+            closed = False
+
+            def close(self) -> None:
+                self.closed = True
+
+        translator = ClosableTranslator()
+        app = self._create_app(translator_factory=lambda: translator)
+        app._process_single_request(TranslationRequest(text="hello", src=None, dest="ja"))
+
+        app.reboot()
+
+        self.assertTrue(translator.closed)
+
 
 class CCTranslationAppLifecycleTests(CCTranslationAppTestMixin, unittest.TestCase):
     def test_stop_after_reboot_exits_start_loop(self):
@@ -335,6 +384,122 @@ class CCTranslationAppLifecycleTests(CCTranslationAppTestMixin, unittest.TestCas
             app.stop()
             thread.join(timeout=1)
 
+    def test_dead_worker_thread_is_restarted(self):
+        app = self._create_app()
+        dead = threading.Thread(target=lambda: None)
+        dead.start()
+        dead.join()
+        app._worker_thread = dead
+
+        app._ensure_worker_thread()
+
+        self.assertIsNot(app._worker_thread, dead)
+        self.assertTrue(app._worker_thread.is_alive())
+
+    def _record_saves(self, save) -> None:
+        original = translator_app._save_dest_language
+        translator_app._save_dest_language = save
+        self.addCleanup(setattr, translator_app, "_save_dest_language", original)
+
+    def test_flush_writes_latest_pending_dest_language(self):
+        saved = []
+        self._record_saves(saved.append)
+        app = self._create_app()
+        app._ensure_persist_thread()
+
+        app._persist_dest_language("en")
+        app._persist_dest_language("ja")
+        app._flush_preferences()
+
+        self.assertEqual(saved[-1], "ja")
+        self.assertFalse(app._persist_thread.is_alive())
+
+    def test_flush_writes_value_set_while_writer_is_busy(self):
+        saved = []
+        writing = threading.Event()
+        release = threading.Event()
+
+        def slow_save(dest: str) -> None:
+            writing.set()
+            release.wait(timeout=1)
+            saved.append(dest)
+
+        self._record_saves(slow_save)
+        app = self._create_app()
+        app._ensure_persist_thread()
+
+        app._persist_dest_language("en")
+        self.assertTrue(writing.wait(timeout=1), "writer did not start saving")
+        app._persist_dest_language("ja")
+        flusher = threading.Thread(target=app._flush_preferences)
+        flusher.start()
+        deadline = time.monotonic() + 1
+        while not app._persist_stopping:
+            if time.monotonic() > deadline:
+                release.set()
+                self.fail("flush did not signal the writer to stop")
+            time.sleep(0.001)
+        release.set()
+        flusher.join(timeout=2)
+
+        self.assertFalse(flusher.is_alive())
+        self.assertEqual(saved[-1], "ja")
+
+
+class PreferencesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "preferences.json"
+        for name, value in (
+            ("PREFERENCES_FILE", self.path),
+            ("_last_saved_dest_language", None),
+        ):
+            self.addCleanup(setattr, translator_app, name, getattr(translator_app, name))
+            setattr(translator_app, name, value)
+
+    def test_save_round_trips_and_skips_unchanged_write(self) -> None:
+        translator_app._save_dest_language("en")
+        self.assertEqual(translator_app._load_saved_dest_language(), "en")
+        self.assertFalse(self.path.with_suffix(".json.tmp").exists())
+
+        self.path.unlink()
+        translator_app._save_dest_language("en")
+        self.assertFalse(self.path.exists(), "unchanged preferences should not be rewritten")
+
+        translator_app._save_dest_language("ja")
+        self.assertEqual(translator_app._load_saved_dest_language(), "ja")
+
+
+class TranslationWindowManagerTests(unittest.TestCase):
+    def test_show_raises_when_window_setup_fails(self) -> None:
+        manager = translator_app.TranslationWindowManager(None, "ja")
+
+        def failing_build():
+            raise RuntimeError("no display")
+
+        manager._build_window = failing_build
+
+        with self.assertRaises(RuntimeError):
+            manager.show("hello", "こんにちは", "en")
+        self.assertIsNone(manager._window)
+
+    def test_show_keeps_item_queued_when_startup_is_slow(self) -> None:
+        manager = translator_app.TranslationWindowManager(None, "ja")
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def slow_build():
+            release.wait(timeout=10)
+            raise RuntimeError("stop test window")
+
+        manager._build_window = slow_build
+        manager._startup_timeout = 0.01
+
+        manager.show("hello", "こんにちは", "en")
+
+        self.assertEqual(manager._queue.get_nowait()[0], "hello")
+
 
 class SystemTrayControllerTests(unittest.TestCase):
     def test_reboot_menu_item_triggers_reboot_and_stops_icon(self) -> None:
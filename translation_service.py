@@ -2,55 +2,160 @@
 
 from __future__ import annotations
 
+import functools
+import http.client
 import json
+import threading
+import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional
 
+try:  # pragma: no cover - optional faster JSON decoder
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - the standard library decoder is used instead
+    orjson = None  # type: ignore
+
+
+_REQUEST_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+# Errors meaning the peer closed a reused keep-alive connection before it saw
+# the request. Timeouts are not included: resending after one doubles the wait.
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
 
 class TranslationError(RuntimeError):
     """Raised when the translation service cannot complete a request."""
 
 
-@dataclass
+@dataclass(frozen=True)
 class TranslationResult:
+    # Declared by hand because ``dataclass(slots=True)`` requires Python 3.10.
+    __slots__ = ("text", "detected_source")
+
     text: str
     detected_source: Optional[str]
 
+    # Frozen slotted instances cannot restore state through ``setattr``, so
+    # copy and pickle need explicit hooks.
+    def __getstate__(self) -> tuple[str, Optional[str]]:
+        return (self.text, self.detected_source)
+
+    def __setstate__(self, state: tuple[str, Optional[str]]) -> None:
+        object.__setattr__(self, "text", state[0])
+        object.__setattr__(self, "detected_source", state[1])
+
+
+def _decode_json(payload: bytes) -> object:
+    """Parse the raw response bytes, preferring ``orjson`` when installed."""
+
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+@functools.lru_cache(maxsize=64)
+def _query_prefix(path: str, src: Optional[str], dest: str) -> str:
+    """Return the request target up to the ``q=`` parameter for a language pair."""
+
+    params = {
+        "client": "gtx",
+        "dt": "t",
+        "sl": (src or "auto"),
+        "tl": dest,
+    }
+    return f"{path}?{urllib.parse.urlencode(params)}&q="
+
 
 class GoogleTranslateClient:
-    """Minimal client for the unofficial Google Translate web API."""
+    """Minimal client for the unofficial Google Translate web API.
+
+    Requests reuse a single keep-alive HTTPS connection so consecutive
+    translations skip the TCP and TLS handshakes. When a system proxy is
+    configured the client falls back to :func:`urllib.request.urlopen`, which
+    already knows how to talk through it.
+
+    The most recent ``cache_size`` results are kept in memory, so translating
+    the same text again (a repeated double copy, or toggling the language back)
+    does not hit the network.
+    """
 
     endpoint = "https://translate.googleapis.com/translate_a/single"
+    # Seconds a pooled connection may sit idle before it is replaced rather
+    # than reused; NATs and firewalls silently drop long-idle sockets.
+    max_idle = 30.0
 
-    def __init__(self, timeout: float = 5.0) -> None:
+    def __init__(self, timeout: float = 5.0, cache_size: int = 256) -> None:
         self.timeout = timeout
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[tuple[str, Optional[str], str], TranslationResult]" = OrderedDict()
+        endpoint = urllib.parse.urlsplit(self.endpoint)
+        self._host = endpoint.netloc
+        self._path = endpoint.path
+        self._use_proxy = bool(urllib.request.getproxies().get("https")) and not (
+            urllib.request.proxy_bypass(endpoint.hostname or self._host)
+        )
+        self._connection: Optional[http.client.HTTPSConnection] = None
+        self._last_used = 0.0
+        # Guards ``_connection`` so ``close`` can be called from another thread.
+        self._connection_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the pooled connection, if one is open."""
+
+        with self._connection_lock:
+            self._drop_connection()
+
+    def warm_up(self) -> None:
+        """Open the pooled connection ahead of the first translation.
+
+        Completes the TCP and TLS handshakes so the first request does not pay
+        for them. Does nothing when requests go through a proxy.
+        """
+
+        if self._use_proxy:
+            return
+        with self._connection_lock:
+            if self._connection is not None:
+                return
+            connection = http.client.HTTPSConnection(self._host, timeout=self.timeout)
+            try:
+                connection.connect()
+            except OSError as exc:
+                connection.close()
+                raise TranslationError("Network error while contacting Google Translate") from exc
+            self._connection = connection
+            self._last_used = time.monotonic()
+
+    def _drop_connection(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
 
     def translate(self, text: str, src: Optional[str], dest: str) -> TranslationResult:
         if not text:
             raise TranslationError("Cannot translate empty text")
 
-        params = {
-            "client": "gtx",
-            "dt": "t",
-            "sl": (src or "auto"),
-            "tl": dest,
-            "q": text,
-        }
-        url = f"{self.endpoint}?{urllib.parse.urlencode(params)}"
-        request = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
+        key = (text, src, dest)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
 
-        try:
-            with urllib.request.urlopen(request, timeout=self.timeout) as response:
-                payload = response.read()
-        except urllib.error.URLError as exc:  # pragma: no cover - network errors are runtime issues
-            raise TranslationError("Network error while contacting Google Translate") from exc
+        path = _query_prefix(self._path, src, dest) + urllib.parse.quote_from_bytes(
+            text.encode("utf-8"), safe=""
+        )
+        if self._use_proxy:
+            payload = self._fetch_via_urllib(path)
+        else:
+            payload = self._fetch(path)
 
         try:
-            data = json.loads(payload.decode("utf-8"))
-        except json.JSONDecodeError as exc:  # pragma: no cover - unexpected response is rare
+            data = _decode_json(payload)
+        except ValueError as exc:  # pragma: no cover - unexpected response is rare
             raise TranslationError("Invalid response from Google Translate") from exc
 
         try:
@@ -58,9 +163,61 @@ class GoogleTranslateClient:
         except (IndexError, TypeError) as exc:  # pragma: no cover - guards against API changes
             raise TranslationError("Unexpected translation response structure") from exc
 
-        translated_text = "".join(part[0] for part in segments if part and part[0])
+        translated_text = "".join([part[0] for part in segments if part and part[0]])
         detected_source = None
         if len(data) > 2:
             detected_source = data[2]
 
-        return TranslationResult(text=translated_text, detected_source=detected_source)
+        result = TranslationResult(text=translated_text, detected_source=detected_source)
+        if self.cache_size > 0:
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def _fetch(self, path: str) -> bytes:
+        """GET ``path`` over the pooled connection.
+
+        A connection idle for longer than ``max_idle`` is replaced before use.
+        If the server closed a reused connection while it was idle, the request
+        is retried once on a fresh one; timeouts are never retried.
+        """
+
+        with self._connection_lock:
+            return self._fetch_locked(path)
+
+    def _fetch_locked(self, path: str) -> bytes:
+        if self._connection is not None and time.monotonic() - self._last_used > self.max_idle:
+            self._drop_connection()
+        while True:
+            reused = self._connection is not None
+            if self._connection is None:
+                self._connection = http.client.HTTPSConnection(self._host, timeout=self.timeout)
+            connection = self._connection
+            try:
+                connection.request("GET", path, headers=_REQUEST_HEADERS)
+                response = connection.getresponse()
+                payload = response.read()
+            except (http.client.HTTPException, OSError) as exc:
+                self._drop_connection()
+                if reused and isinstance(exc, _STALE_CONNECTION_ERRORS):
+                    continue
+                raise TranslationError("Network error while contacting Google Translate") from exc
+
+            self._last_used = time.monotonic()
+            if response.will_close:
+                self._drop_connection()
+            if response.status != 200:
+                raise TranslationError(
+                    f"Google Translate responded with HTTP {response.status}"
+                )
+            return payload
+
+    def _fetch_via_urllib(self, path: str) -> bytes:
+        url = f"https://{self._host}{path}"
+        request = urllib.request.Request(url, headers=_REQUEST_HEADERS)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.read()
+        except urllib.error.URLError as exc:  # pragma: no cover - network errors are runtime issues
+            raise TranslationError("Network error while contacting Google Translate") from exc
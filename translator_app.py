@@ -8,10 +8,10 @@ import json
 import queue
 import threading
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from pathlib import Path
 from types import SimpleNamespace
-from typing import IO, Callable, Optional, Protocol
+from typing import IO, Callable, NamedTuple, Optional, Protocol
 
 try:  # pragma: no cover - executed during module import
     import keyboard  # type: ignore
@@ -42,9 +42,40 @@ except ImportError:  # pragma: no cover - handled when starting the tray icon
     Image = None  # type: ignore
     ImageDraw = None  # type: ignore
 
+import os
 import sys
 import tempfile
 
+if sys.platform == "win32":  # pragma: no cover - platform specific
+    import ctypes
+    import msvcrt  # type: ignore
+    from ctypes import wintypes
+
+    # Private library handles so the prototypes below do not leak into other
+    # modules (keyboard, pyperclip) that share ``ctypes.windll``.
+    _user32 = ctypes.WinDLL("user32")  # type: ignore[attr-defined]
+    _kernel32 = ctypes.WinDLL("kernel32")  # type: ignore[attr-defined]
+    _user32.GetForegroundWindow.restype = wintypes.HWND
+    _user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+    _user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+
+    _MONITOR_DEFAULTTONEAREST = 2
+
+    class _MONITORINFO(ctypes.Structure):
+        _fields_ = [
+            ("cbSize", wintypes.DWORD),
+            ("rcMonitor", wintypes.RECT),
+            ("rcWork", wintypes.RECT),
+            ("dwFlags", wintypes.DWORD),
+        ]
+
+    _user32.MonitorFromPoint.restype = wintypes.HMONITOR
+    _user32.MonitorFromPoint.argtypes = [wintypes.POINT, wintypes.DWORD]
+    _user32.GetMonitorInfoW.restype = wintypes.BOOL
+    _user32.GetMonitorInfoW.argtypes = [wintypes.HMONITOR, ctypes.POINTER(_MONITORINFO)]
+else:  # pragma: no cover - exercised on non-Windows platforms
+    import fcntl  # type: ignore
+
 from translation_service import GoogleTranslateClient, TranslationError, TranslationResult
 
 
@@ -61,38 +92,74 @@ LANGUAGE_DISPLAY_NAMES = {
 }
 
 
+# Destination language last written (or read) by this process, used to skip
+# rewriting an unchanged preferences file.
+_last_saved_dest_language: Optional[str] = None
+
+
 def _load_saved_dest_language(default: str = "ja") -> str:
+    global _last_saved_dest_language
     try:
         data = json.loads(PREFERENCES_FILE.read_text(encoding="utf-8"))
     except (FileNotFoundError, json.JSONDecodeError, OSError):
         return default
     dest = data.get("dest_language") if isinstance(data, dict) else None
-    return dest if isinstance(dest, str) else default
+    if not isinstance(dest, str):
+        return default
+    _last_saved_dest_language = dest
+    return dest
 
 
 def _save_dest_language(dest: str) -> None:
+    """Persist ``dest`` atomically, skipping the write if nothing changed."""
+
+    global _last_saved_dest_language
+    if dest == _last_saved_dest_language:
+        return
+    temp_path = PREFERENCES_FILE.with_suffix(".json.tmp")
     try:
         PREFERENCES_FILE.parent.mkdir(parents=True, exist_ok=True)
-        PREFERENCES_FILE.write_text(json.dumps({"dest_language": dest}), encoding="utf-8")
+        with temp_path.open("w", encoding="utf-8") as handle:
+            json.dump({"dest_language": dest}, handle)
+        os.replace(temp_path, PREFERENCES_FILE)
     except OSError:
-        pass
+        return
+    _last_saved_dest_language = dest
 
 
 def _language_display(language_code: Optional[str]) -> str:
-    if language_code is None:
-        return LANGUAGE_DISPLAY_NAMES[None]
+    # ``None`` has its own entry, so a single lookup covers auto-detection too.
     return LANGUAGE_DISPLAY_NAMES.get(language_code, language_code)
 
 
+_font_families: Optional[dict[str, str]] = None
+_font_families_lock = threading.Lock()
+
+
+def _available_font_families() -> dict[str, str]:
+    """Return installed font families keyed by their lower-cased name.
+
+    Enumerating every family through Tcl is slow on systems with many fonts,
+    so the table is built once and shared by every window the process creates.
+    """
+
+    global _font_families
+    with _font_families_lock:
+        if _font_families is None:
+            _font_families = {name.lower(): name for name in tkfont.families()}
+        return _font_families
+
+
+_RESOURCE_BASE_PATH = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent))  # type: ignore[attr-defined]
+
+
 def _resource_path(relative_path: str) -> Path:
     """Return an absolute path to a bundled resource."""
 
-    base_path = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent))  # type: ignore[attr-defined]
-    return base_path / relative_path
+    return _RESOURCE_BASE_PATH / relative_path
 
 
-@dataclass
-class TranslationRequest:
+class TranslationRequest(NamedTuple):
     text: str
     src: Optional[str]
     dest: str
@@ -104,14 +171,21 @@ class TranslatorProtocol(Protocol):  # pragma: no cover - protocol is for type c
         """Translate text and return a result object."""
 
 
-@dataclass
 class DoubleCopyDetector:
-    """Utility that tracks consecutive copy events within a time window."""
+    """Utility that tracks consecutive copy events within a time window.
+
+    Not thread-safe: it is only driven from the keyboard hook thread.
+    """
 
-    interval: float
-    now: Callable[[], float]
-    _last_time: float = field(default=0.0, init=False)
-    _count: int = field(default=0, init=False)
+    # A plain slotted class rather than a dataclass: ``dataclass(slots=True)``
+    # requires Python 3.10.
+    __slots__ = ("interval", "now", "_last_time", "_count")
+
+    def __init__(self, interval: float, now: Callable[[], float]) -> None:
+        self.interval = interval
+        self.now = now
+        self._last_time = 0.0
+        self._count = 0
 
     def register(self) -> bool:
         """Register a copy event.
@@ -156,13 +230,9 @@ class SingleInstanceGuard:
         self._lock_file = open(self._lock_path, "a+")
         try:
             if sys.platform == "win32":  # pragma: no cover - platform specific
-                import msvcrt  # type: ignore
-
                 self._lock_file.seek(0)
                 msvcrt.locking(self._lock_file.fileno(), msvcrt.LK_NBLCK, 1)
             else:  # pragma: no cover - exercised on non-Windows platforms
-                import fcntl  # type: ignore
-
                 fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
         except OSError as exc:
             self.release()
@@ -173,16 +243,12 @@ class SingleInstanceGuard:
             return
         try:
             if sys.platform == "win32":  # pragma: no cover - platform specific
-                import msvcrt  # type: ignore
-
                 self._lock_file.seek(0)
                 try:
                     msvcrt.locking(self._lock_file.fileno(), msvcrt.LK_UNLCK, 1)
                 except OSError:
                     pass
             else:  # pragma: no cover - exercised on non-Windows platforms
-                import fcntl  # type: ignore
-
                 try:
                     fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
                 except OSError:
@@ -206,6 +272,17 @@ class SingleInstanceGuard:
 class TranslationWindowManager:
     """Create and reuse a single Tk window for displaying translations."""
 
+    # Seconds ``show`` waits for a new window before leaving the item queued.
+    _startup_timeout = 5.0
+
+    # ``(code, label)`` pairs for the language drop-down menus.
+    _SOURCE_MENU_OPTIONS: tuple[tuple[Optional[str], str], ...] = tuple(
+        (code, _language_display(code or "auto")) for code in (None, "ja", "en")
+    )
+    _DEST_MENU_OPTIONS: tuple[tuple[str, str], ...] = tuple(
+        (code, _language_display(code)) for code in ("ja", "en")
+    )
+
     def __init__(
         self,
         source_language: Optional[str],
@@ -218,7 +295,6 @@ class TranslationWindowManager:
         self._source_language = source_language
         self._dest_language = dest_language
         self._queue: "queue.Queue[tuple[str, str, Optional[str], bool]]" = queue.Queue()
-        self._ready = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._language_toggle_callback = language_toggle_callback
         self._source_language_callback = source_language_callback
@@ -227,6 +303,13 @@ class TranslationWindowManager:
         self._toggle_button: Optional[tk.Button] = None
         self._source_button: Optional[tk.Button] = None
         self._dest_button: Optional[tk.Button] = None
+        self._source_menu: Optional[tk.Menu] = None
+        self._dest_menu: Optional[tk.Menu] = None
+        # Button labels currently shown, so unchanged selections skip the Tcl call.
+        self._last_source_text: Optional[str] = None
+        self._last_dest_text: Optional[str] = None
+        self._base_family: Optional[str] = None
+        self._apply_update: Optional[Callable[[], None]] = None
 
     def show(
         self,
@@ -236,12 +319,31 @@ class TranslationWindowManager:
         *,
         reposition: bool = True,
     ) -> None:
+        # Enqueue first: a freshly started window drains the queue once setup
+        # finishes, so the item is shown even if setup outlasts the wait below.
+        self._queue.put((original, translated, detected_source, reposition))
         if self._thread is None or not self._thread.is_alive():
-            self._ready.clear()
-            self._thread = threading.Thread(target=self._run_window, daemon=True)
+            # The future carries setup errors (e.g. no display) back to the
+            # caller instead of leaving it waiting forever.
+            startup: "Future[None]" = Future()
+            self._thread = threading.Thread(target=self._run_window, args=(startup,), daemon=True)
             self._thread.start()
-            self._ready.wait()
-        self._queue.put((original, translated, detected_source, reposition))
+            try:
+                startup.result(timeout=self._startup_timeout)
+            except FutureTimeoutError:
+                pass  # Slow but still starting; its initial drain renders the item.
+            return
+        window = self._window
+        apply_update = self._apply_update
+        if window is not None and apply_update is not None:
+            window.after(0, apply_update)
+
+    def close(self) -> None:
+        """Destroy the window and end its Tk loop. Called once at shutdown."""
+
+        window = self._window
+        if window is not None:
+            window.after(0, window.destroy)
 
     def update_languages(self, source_language: Optional[str], dest_language: str) -> None:
         self._source_language = source_language
@@ -251,9 +353,15 @@ class TranslationWindowManager:
 
     def _update_language_widgets(self) -> None:
         if self._source_button is not None:
-            self._source_button.configure(text=self._source_button_text())
+            source_text = self._source_button_text()
+            if source_text != self._last_source_text:
+                self._source_button.configure(text=source_text)
+                self._last_source_text = source_text
         if self._dest_button is not None:
-            self._dest_button.configure(text=self._dest_button_text())
+            dest_text = self._dest_button_text()
+            if dest_text != self._last_dest_text:
+                self._dest_button.configure(text=dest_text)
+                self._last_dest_text = dest_text
 
     def _source_button_text(self) -> str:
         display = _language_display(self._source_language or "auto")
@@ -294,36 +402,27 @@ class TranslationWindowManager:
         if self._language_toggle_callback is not None:
             self._language_toggle_callback()
 
-    def _open_source_menu(self, widget: tk.Widget) -> None:
-        if self._window is None:
-            return
-        menu = tk.Menu(self._window, tearoff=0)
-        options: tuple[Optional[str], ...] = (None, "ja", "en")
-        for code in options:
-            label = _language_display(code or "auto")
-            menu.add_command(
+    def _build_language_menus(self, window: tk.Tk) -> None:
+        """Create the language drop-down menus once for the lifetime of ``window``."""
+
+        source_menu = tk.Menu(window, tearoff=0)
+        for code, label in self._SOURCE_MENU_OPTIONS:
+            source_menu.add_command(
                 label=label,
                 command=lambda c=code: self._on_source_language_selected(c),
             )
-        try:
-            menu.tk_popup(
-                widget.winfo_rootx(),
-                widget.winfo_rooty() + widget.winfo_height(),
-            )
-        finally:
-            menu.grab_release()
+        self._source_menu = source_menu
 
-    def _open_dest_menu(self, widget: tk.Widget) -> None:
-        if self._window is None:
-            return
-        menu = tk.Menu(self._window, tearoff=0)
-        options: tuple[str, ...] = ("ja", "en")
-        for code in options:
-            label = _language_display(code)
-            menu.add_command(
+        dest_menu = tk.Menu(window, tearoff=0)
+        for code, label in self._DEST_MENU_OPTIONS:
+            dest_menu.add_command(
                 label=label,
                 command=lambda c=code: self._on_dest_language_selected(c),
             )
+        self._dest_menu = dest_menu
+
+    @staticmethod
+    def _popup_menu(menu: tk.Menu, widget: tk.Widget) -> None:
         try:
             menu.tk_popup(
                 widget.winfo_rootx(),
@@ -332,7 +431,17 @@ class TranslationWindowManager:
         finally:
             menu.grab_release()
 
-    def _run_window(self) -> None:
+    def _open_source_menu(self, widget: tk.Widget) -> None:
+        if self._source_menu is None:
+            return
+        self._popup_menu(self._source_menu, widget)
+
+    def _open_dest_menu(self, widget: tk.Widget) -> None:
+        if self._dest_menu is None:
+            return
+        self._popup_menu(self._dest_menu, widget)
+
+    def _build_window(self) -> tk.Tk:
         window = tk.Tk()
         self._window = window
         window.title("CCTranslationTool")
@@ -349,9 +458,7 @@ class TranslationWindowManager:
             "Arial",
             default_font.actual("family"),
         )
-        available_families = {
-            name.lower(): name for name in tkfont.families()
-        }
+        available_families = _available_font_families()
 
         def resolve_family(preferences: tuple[str, ...]) -> str:
             for family in preferences:
@@ -360,7 +467,9 @@ class TranslationWindowManager:
                     return available_families[key]
             return default_font.actual("family")
 
-        base_family = resolve_family(preferred_families)
+        if self._base_family is None:
+            self._base_family = resolve_family(preferred_families)
+        base_family = self._base_family
         button_font = tkfont.Font(family=base_family, size=11)
         toggle_font = tkfont.Font(family=base_family, size=14, weight="bold")
         label_font = tkfont.Font(family=base_family, size=10, weight="bold")
@@ -382,6 +491,7 @@ class TranslationWindowManager:
         )
         source_button.pack(side=tk.LEFT, expand=True, fill=tk.X)
         self._source_button = source_button
+        self._last_source_text = source_button.cget("text")
 
         toggle_button = tk.Button(
             controls_frame,
@@ -404,6 +514,9 @@ class TranslationWindowManager:
         )
         dest_button.pack(side=tk.LEFT, expand=True, fill=tk.X)
         self._dest_button = dest_button
+        self._last_dest_text = dest_button.cget("text")
+
+        self._build_language_menus(window)
 
         content_pane = tk.PanedWindow(window, orient=tk.VERTICAL, sashwidth=6)
         content_pane.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
@@ -429,6 +542,8 @@ class TranslationWindowManager:
         translated_box.pack(fill=tk.BOTH, expand=True)
 
         def hide_window() -> None:
+            # Only withdraw: ``mainloop`` keeps running, so the next ``show``
+            # reuses this window instead of booting a new Tk interpreter.
             window.withdraw()
 
         def handle_escape(event: tk.Event) -> str:
@@ -447,39 +562,19 @@ class TranslationWindowManager:
             # when querying ``winfo_screenwidth``/``winfo_screenheight``.  We fall back
             # to the Windows API so the popup can be constrained to whichever monitor
             # currently hosts the cursor.
-            import sys
-
             if sys.platform != "win32":
                 return None
 
-            try:
-                import ctypes
-                from ctypes import wintypes
-            except Exception:  # pragma: no cover - only executed on Windows
-                return None
-
-            MONITOR_DEFAULTTONEAREST = 2
-
-            user32 = ctypes.windll.user32  # type: ignore[attr-defined]
-
-            class MONITORINFO(ctypes.Structure):  # pragma: no cover - Windows only
-                _fields_ = [
-                    ("cbSize", wintypes.DWORD),
-                    ("rcMonitor", wintypes.RECT),
-                    ("rcWork", wintypes.RECT),
-                    ("dwFlags", wintypes.DWORD),
-                ]
-
-            monitor = user32.MonitorFromPoint(  # pragma: no cover - Windows only
+            monitor = _user32.MonitorFromPoint(  # pragma: no cover - Windows only
                 wintypes.POINT(pointer_x, pointer_y),
-                MONITOR_DEFAULTTONEAREST,
+                _MONITOR_DEFAULTTONEAREST,
             )
             if not monitor:
                 return None
 
-            info = MONITORINFO()
-            info.cbSize = ctypes.sizeof(MONITORINFO)
-            if not user32.GetMonitorInfoW(monitor, ctypes.byref(info)):
+            info = _MONITORINFO()
+            info.cbSize = ctypes.sizeof(_MONITORINFO)
+            if not _user32.GetMonitorInfoW(monitor, ctypes.byref(info)):
                 return None
 
             work = info.rcWork
@@ -512,19 +607,11 @@ class TranslationWindowManager:
         def _force_foreground() -> None:
             """Ensure the Tk window becomes the active foreground window."""
 
-            import sys
-
             if sys.platform != "win32":
                 return
 
-            try:  # pragma: no cover - Windows specific implementation
-                import ctypes
-                from ctypes import wintypes
-            except Exception:  # pragma: no cover - if ctypes is unavailable
-                return
-
-            user32 = ctypes.windll.user32  # type: ignore[attr-defined]
-            kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+            user32 = _user32  # pragma: no cover - Windows specific implementation
+            kernel32 = _kernel32
 
             hwnd = wintypes.HWND(window.winfo_id())
             if not hwnd:
@@ -534,14 +621,10 @@ class TranslationWindowManager:
 
             user32.ShowWindow(hwnd, SW_SHOWNORMAL)
 
-            user32.GetForegroundWindow.restype = wintypes.HWND
             foreground_hwnd = user32.GetForegroundWindow()
             if foreground_hwnd == hwnd:
                 return
 
-            user32.GetWindowThreadProcessId.restype = wintypes.DWORD
-            user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
-
             pid = wintypes.DWORD()
             foreground_thread_id = user32.GetWindowThreadProcessId(
                 foreground_hwnd, ctypes.byref(pid)
@@ -561,6 +644,12 @@ class TranslationWindowManager:
                 if attached:
                     user32.AttachThreadInput(foreground_thread_id, current_thread_id, False)
 
+        display_state = SimpleNamespace(original=None, translated=None, topmost_reset=None)
+
+        def clear_topmost() -> None:
+            display_state.topmost_reset = None
+            window.attributes("-topmost", False)
+
         def bring_to_front(reposition: bool) -> None:
             if reposition:
                 place_near_pointer()
@@ -568,38 +657,77 @@ class TranslationWindowManager:
             window.lift()
             _force_foreground()
             window.attributes("-topmost", True)
-            window.after(100, lambda: window.attributes("-topmost", False))
+            # Keep a single pending reset so rapid updates do not pile up timers.
+            if display_state.topmost_reset is not None:
+                window.after_cancel(display_state.topmost_reset)
+            display_state.topmost_reset = window.after(100, clear_topmost)
             window.focus_force()
 
         def apply_update() -> None:
+            # Drain everything queued since the last update and render only the
+            # newest entry; earlier ones would be overwritten immediately.
+            items = []
             try:
                 while True:
-                    original, translated, detected_source, reposition = self._queue.get_nowait()
-                    original_box.configure(state=tk.NORMAL)
-                    original_box.delete("1.0", tk.END)
-                    original_box.insert(tk.END, original)
-                    original_box.configure(state=tk.DISABLED)
-                    translated_box.configure(state=tk.NORMAL)
-                    translated_box.delete("1.0", tk.END)
-                    translated_box.insert(tk.END, translated)
-                    translated_box.configure(state=tk.DISABLED)
-                    bring_to_front(reposition)
+                    items.append(self._queue.get_nowait())
             except queue.Empty:
                 pass
-            window.after(100, apply_update)
+            if not items:
+                return
 
-        self._ready.set()
-        apply_update()
+            original, translated, detected_source, _ = items[-1]
+            reposition = any(item[3] for item in items)
+            # Re-showing the same translation only needs the window raised.
+            if original != display_state.original:
+                original_box.configure(state=tk.NORMAL)
+                original_box.replace("1.0", tk.END, original)
+                original_box.configure(state=tk.DISABLED)
+                display_state.original = original
+            if translated != display_state.translated:
+                translated_box.configure(state=tk.NORMAL)
+                translated_box.replace("1.0", tk.END, translated)
+                translated_box.configure(state=tk.DISABLED)
+                display_state.translated = translated
+            bring_to_front(reposition)
+
+        # ``show`` schedules a drain after every enqueue, so the Tk loop stays
+        # idle between translations instead of polling the queue.
+        self._apply_update = apply_update
+        return window
+
+    def _run_window(self, startup: "Future[None]") -> None:
+        try:
+            window = self._build_window()
+        except BaseException as exc:
+            if self._window is not None:
+                with contextlib.suppress(tk.TclError):
+                    self._window.destroy()
+            self._reset_window_state()
+            startup.set_exception(exc)
+            return
+        startup.set_result(None)
+        if self._apply_update is not None:
+            self._apply_update()
         window.mainloop()
+        self._reset_window_state()
+
+    def _reset_window_state(self) -> None:
+        self._apply_update = None
         self._window = None
         self._toggle_button = None
         self._source_button = None
         self._dest_button = None
+        self._source_menu = None
+        self._dest_menu = None
+        self._last_source_text = None
+        self._last_dest_text = None
 
 
 class SystemTrayController:
     """Manage a Windows system tray icon with Reboot and Exit commands."""
 
+    _icon_image_cache: Optional["Image.Image"] = None
+
     def __init__(self, app: "CCTranslationApp") -> None:
         self._app = app
         self._icon: Optional["pystray.Icon"] = None
@@ -648,6 +776,15 @@ class SystemTrayController:
         icon.stop()
 
     def _create_icon_image(self) -> "Image.Image":
+        # The decoded icon is shared across reboots; pystray gets its own copy.
+        cached = SystemTrayController._icon_image_cache
+        if cached is None:
+            cached = self._load_icon_image()
+            SystemTrayController._icon_image_cache = cached
+        return cached.copy()
+
+    @staticmethod
+    def _load_icon_image() -> "Image.Image":
         assert Image is not None  # noqa: S101 - guarded by _is_supported
 
         icon_path = _resource_path("icon/CCT_icon.png")
@@ -689,10 +826,16 @@ class CCTranslationApp:
         self._translator_lock = threading.Lock()
         self._copy_detector = DoubleCopyDetector(double_copy_interval, time_provider)
         self._lock = threading.Lock()
-        self._request_queue: "queue.Queue[TranslationRequest]" = queue.Queue()
+        self._request_queue: "queue.SimpleQueue[TranslationRequest]" = queue.SimpleQueue()
         self._stop_event = threading.Event()
         self._restart_event = threading.Event()
         self._worker_thread: Optional[threading.Thread] = None
+        # Newest destination language for the preferences thread to write; the
+        # thread always writes the latest value, so bursts of changes coalesce.
+        self._pending_dest_language: Optional[str] = None
+        self._persist_event = threading.Event()
+        self._persist_stopping = False
+        self._persist_thread: Optional[threading.Thread] = None
         if keyboard_module is None:
             raise RuntimeError(
                 "The 'keyboard' package is required. Install it with 'pip install keyboard'."
@@ -717,27 +860,39 @@ class CCTranslationApp:
 
     @property
     def translator(self) -> TranslatorProtocol:
-        with self._translator_lock:
-            if self._translator is None:
-                self._translator = self._translator_factory()
-            translator = self._translator
-        assert translator is not None  # For type checkers
+        # Double-checked: the lock is only taken until the translator exists.
+        # ``_reset_translator`` still takes it, so a reboot waits for an
+        # in-flight construction to finish.
+        translator = self._translator
+        if translator is None:
+            with self._translator_lock:
+                translator = self._translator
+                if translator is None:
+                    translator = self._translator_factory()
+                    self._translator = translator
         return translator
 
     def _reset_translator(self) -> None:
         with self._translator_lock:
-            self._translator = None
+            translator, self._translator = self._translator, None
+        # Release the old client's pooled connection instead of leaving the
+        # socket open until garbage collection.
+        close = getattr(translator, "close", None)
+        if close is not None:
+            close()
 
     def start(self, *, tray_controller: Optional[SystemTrayController] = None) -> None:
         """Start listening for keyboard events and processing translations."""
 
         self._tray_controller = tray_controller
-
-        if self._worker_thread is None or not self._worker_thread.is_alive():
-            self._worker_thread = threading.Thread(target=self._process_requests, daemon=True)
-            self._worker_thread.start()
+        self._ensure_worker_thread()
+        self._ensure_persist_thread()
 
         while True:
+            # A new translator is needed on first start and after each reboot;
+            # prepare it in parallel with hook registration.
+            if self._translator is None:
+                threading.Thread(target=self._warm_up_translator, daemon=True).start()
             self._keyboard.add_hotkey("ctrl+c", self._handle_copy_event, suppress=False)
 
             print(
@@ -747,7 +902,10 @@ class CCTranslationApp:
                 self._tray_controller.start()
 
             try:
-                self._stop_event.wait()
+                # Wake up periodically to restart a worker that died on an
+                # unexpected error; this also lets Ctrl+C interrupt the wait on Windows.
+                while not self._stop_event.wait(timeout=1.0):
+                    self._ensure_worker_thread()
             except KeyboardInterrupt:  # pragma: no cover - manual console interruption
                 self.stop()
             finally:
@@ -762,6 +920,63 @@ class CCTranslationApp:
 
             break
 
+        self._flush_preferences()
+        self._window_manager.close()
+
+    def _warm_up_translator(self) -> None:
+        """Build the translator and open its connection before the first copy."""
+
+        # Runs on a throwaway thread, so failures are reported here; the first
+        # translation retries and reports its own error if the problem persists.
+        try:
+            warm_up = getattr(self.translator, "warm_up", None)
+            if warm_up is not None:
+                warm_up()
+        except Exception as exc:
+            print(f"Failed to prepare the translator: {exc!r}")
+
+    def _ensure_worker_thread(self) -> None:
+        if self._worker_thread is None or not self._worker_thread.is_alive():
+            self._worker_thread = threading.Thread(target=self._process_requests, daemon=True)
+            self._worker_thread.start()
+
+    def _ensure_persist_thread(self) -> None:
+        if self._persist_thread is None or not self._persist_thread.is_alive():
+            self._persist_stopping = False
+            self._persist_thread = threading.Thread(target=self._write_preferences, daemon=True)
+            self._persist_thread.start()
+
+    def _persist_dest_language(self, dest: str) -> None:
+        """Hand ``dest`` to the preferences thread instead of writing it inline."""
+
+        self._pending_dest_language = dest
+        self._persist_event.set()
+
+    def _write_preferences(self) -> None:
+        while True:
+            self._persist_event.wait()
+            self._persist_event.clear()
+            dest = self._pending_dest_language
+            if dest is not None:
+                _save_dest_language(dest)
+            if self._persist_stopping:
+                return
+
+    def _flush_preferences(self) -> None:
+        """Make sure the latest destination language is on disk before exiting."""
+
+        thread = self._persist_thread
+        if thread is not None and thread.is_alive():
+            self._persist_stopping = True
+            self._persist_event.set()
+            thread.join(timeout=2.0)
+            if thread.is_alive():
+                return
+        # The writer may have stopped right after saving an older value, so
+        # write the newest one here; an unchanged value is not rewritten.
+        if self._pending_dest_language is not None:
+            _save_dest_language(self._pending_dest_language)
+
     def stop(self) -> None:
         """Signal the application to shut down."""
 
@@ -786,11 +1001,11 @@ class CCTranslationApp:
                     current_index = -1
                 next_index = (current_index + 1) % len(self._language_options)
                 self.dest_language = self._language_options[next_index]
-            self._window_manager.update_languages(self.source_language, self.dest_language)
-            _save_dest_language(self.dest_language)
             last_text = self._last_original_text
             src = self.source_language
             dest = self.dest_language
+        self._window_manager.update_languages(src, dest)
+        self._persist_dest_language(dest)
         self._enqueue_retranslation(last_text, src, dest)
 
     def _set_dest_language(self, language: str) -> None:
@@ -798,52 +1013,72 @@ class CCTranslationApp:
             self.dest_language = language
             if language not in self._language_options:
                 self._language_options.append(language)
-            self._window_manager.update_languages(self.source_language, self.dest_language)
-            _save_dest_language(self.dest_language)
             last_text = self._last_original_text
             src = self.source_language
             dest = self.dest_language
+        self._window_manager.update_languages(src, dest)
+        self._persist_dest_language(dest)
         self._enqueue_retranslation(last_text, src, dest)
 
     def _set_source_language(self, language: Optional[str]) -> None:
         with self._lock:
             self.source_language = language
-            self._window_manager.update_languages(self.source_language, self.dest_language)
             last_text = self._last_original_text
             src = self.source_language
             dest = self.dest_language
+        self._window_manager.update_languages(src, dest)
         self._enqueue_retranslation(last_text, src, dest)
 
     def _handle_copy_event(self) -> None:
-        with self._lock:
-            if self._copy_detector.register():
-                try:
-                    text = self._clipboard.paste()
-                except Exception as exc:  # pragma: no cover - exercised via unit tests
-                    if pyperclip is not None and isinstance(exc, pyperclip.PyperclipException):
-                        message = f"Failed to read clipboard: {exc}"
-                    else:
-                        message = f"Unexpected error while accessing clipboard: {exc}"
-                    print(message)
-                    self._copy_detector.reset()
-                    return
-                text = text.strip()
-                if text:
-                    self._request_queue.put(
-                        TranslationRequest(text=text, src=self.source_language, dest=self.dest_language)
-                    )
+        # Runs on the keyboard hook thread, the only caller of the copy detector,
+        # so the lock is only needed to read a consistent language pair.
+        if not self._copy_detector.register():
+            return
+        try:
+            text = self._clipboard.paste()
+        except Exception as exc:  # pragma: no cover - exercised via unit tests
+            if pyperclip is not None and isinstance(exc, pyperclip.PyperclipException):
+                message = f"Failed to read clipboard: {exc}"
+            else:
+                message = f"Unexpected error while accessing clipboard: {exc}"
+            print(message)
+            self._copy_detector.reset()
+            return
+        text = text.strip()
+        if text:
+            with self._lock:
+                src = self.source_language
+                dest = self.dest_language
+            self._request_queue.put(TranslationRequest(text=text, src=src, dest=dest))
 
     def _process_requests(self) -> None:
         while True:
-            request = self._request_queue.get()
-            try:
-                self._process_single_request(request)
-            finally:
-                self._request_queue.task_done()
+            self._process_single_request(self._next_request())
+
+    def _next_request(self) -> TranslationRequest:
+        """Block for a request, then coalesce any backlog into the newest one.
+
+        Requests queued while a translation was in flight are superseded by the
+        most recent copy, so only that one is translated. It keeps
+        ``reposition`` if any skipped request asked for it.
+        """
+
+        request = self._request_queue.get()
+        reposition = request.reposition
+        try:
+            while True:
+                request = self._request_queue.get_nowait()
+                reposition = reposition or request.reposition
+        except queue.Empty:
+            pass
+        if reposition and not request.reposition:
+            request = request._replace(reposition=True)
+        return request
 
     def _process_single_request(self, request: TranslationRequest) -> None:
-        with self._lock:
-            self._last_original_text = request.text
+        # A single reference store is atomic under the GIL; the lock is only
+        # needed where the language pair and this text are read together.
+        self._last_original_text = request.text
         try:
             translation = self.translator.translate(request.text, src=request.src, dest=request.dest)
         except TranslationError as exc:  # pragma: no cover - network errors are runtime issues
@@ -854,8 +1089,16 @@ class CCTranslationApp:
             )
             return
 
-        translated_text = getattr(translation, "text", str(translation))
-        detected_source = getattr(translation, "detected_source", getattr(translation, "src", None))
+        if isinstance(translation, TranslationResult):
+            translated_text = translation.text
+            detected_source = translation.detected_source
+        else:
+            # Other translator implementations may return any object exposing
+            # ``text`` and ``detected_source`` (or ``src``).
+            translated_text = getattr(translation, "text", None)
+            if translated_text is None:
+                translated_text = str(translation)
+            detected_source = getattr(translation, "detected_source", getattr(translation, "src", None))
         self._render_translation(request, translated_text, detected_source)
 
     def _render_translation(
@@ -867,12 +1110,15 @@ class CCTranslationApp:
         if self._display_callback is not None:
             self._display_callback(request.text, translated, detected_source)
         else:
-            self._show_translation_window(
-                request.text,
-                translated,
-                detected_source,
-                reposition=request.reposition,
-            )
+            try:
+                self._show_translation_window(
+                    request.text,
+                    translated,
+                    detected_source,
+                    reposition=request.reposition,
+                )
+            except Exception as exc:
+                print(f"Failed to show translation window: {exc!r}")
 
     def _show_translation_window(
         self,